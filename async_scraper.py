@@ -0,0 +1,162 @@
+"""
+SteamUnlocked Scraper - async variant built on aiohttp
+
+Fetches pages concurrently (bounded by a semaphore) while reusing the
+parsing logic from the synchronous scraper. The dominant cost of the
+scraper is HTTP round-trip latency, so overlapping requests turns N
+sequential fetches into roughly N / max_concurrency wall-clock time.
+"""
+import asyncio
+import random
+import time
+from typing import List, Optional
+
+import aiohttp
+
+from models import Game, GameDetails
+from scraper import SteamUnlockedScraper
+
+
+class _AsyncTokenBucket:
+    """Token bucket that paces outgoing requests without blocking the loop"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AsyncSteamUnlockedScraper(SteamUnlockedScraper):
+    """
+    Async scraper for SteamUnlocked
+
+    Inherits the HTML parsing from SteamUnlockedScraper but replaces the
+    blocking requests.Session with an aiohttp.ClientSession, so many
+    pages can be in flight at once. Use as an async context manager:
+
+        async with AsyncSteamUnlockedScraper() as scraper:
+            games = await scraper.search_games("diablo")
+    """
+
+    def __init__(self, request_delay: float = 0.1, max_concurrency: int = 64):
+        """
+        Initialize the async scraper
+
+        Args:
+            request_delay: Minimum delay between request starts in seconds
+            max_concurrency: Maximum number of in-flight requests
+        """
+        self.request_delay = request_delay
+        self.max_concurrency = max_concurrency
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._bucket = _AsyncTokenBucket(request_delay)
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrency)
+
+    async def __aenter__(self) -> "AsyncSteamUnlockedScraper":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _ensure_session(self):
+        """Create the aiohttp session on first use"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_concurrency,
+                keepalive_timeout=60,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "User-Agent": random.choice(self.USER_AGENTS),
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.5",
+                    "Accept-Encoding": "gzip, deflate, br",
+                },
+            )
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def _fetch(self, url: str, timeout: int = 30) -> bytes:
+        """
+        Fetch a URL with rate limiting and bounded concurrency
+
+        Args:
+            url: URL to request
+            timeout: Request timeout in seconds
+
+        Returns:
+            Raw response body
+        """
+        await self._ensure_session()
+        await self._bucket.acquire()
+        async with self._semaphore:
+            try:
+                async with self.session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    return await response.read()
+            except aiohttp.ClientError as e:
+                raise Exception(f"Request failed: {str(e)}")
+
+    async def search_games(self, query: str, max_results: int = 20) -> List[Game]:
+        """Async version of SteamUnlockedScraper.search_games"""
+        from urllib.parse import quote
+
+        search_url = f"{self.BASE_URL}/?s={quote(query, safe='')}"
+        content = await self._fetch(search_url)
+        return self._parse_search_page(content.decode("utf-8", "replace"), max_results)
+
+    async def get_game_details(self, game_url: str) -> Optional[GameDetails]:
+        """Async version of SteamUnlockedScraper.get_game_details"""
+        content = await self._fetch(game_url)
+        return self._parse_game_page(content, game_url)
+
+    async def get_games_by_category(self, category: str, page: int = 1) -> List[Game]:
+        """Async version of SteamUnlockedScraper.get_games_by_category"""
+        category_url = f"{self.BASE_URL}/category/{category.lower()}/"
+        if page > 1:
+            category_url += f"page/{page}/"
+
+        content = await self._fetch(category_url)
+        return self._parse_category_page(content.decode("utf-8", "replace"))
+
+    async def get_games_a_z(self, letter: Optional[str] = None, page: int = 1) -> List[Game]:
+        """Async version of SteamUnlockedScraper.get_games_a_z"""
+        url = f"{self.BASE_URL}/all-games/"
+        if letter:
+            url += f"?letter={letter.lower()}"
+        if page > 1:
+            separator = "&" if letter else "?"
+            url += f"{separator}page={page}"
+
+        content = await self._fetch(url)
+        return self._parse_az_page(content.decode("utf-8", "replace"))
+
+    async def get_many_game_details(self, game_urls: List[str]) -> List[Optional[GameDetails]]:
+        """
+        Fetch details for many games concurrently
+
+        Args:
+            game_urls: URLs of the game pages
+
+        Returns:
+            GameDetails per URL, in input order; None for failed fetches
+        """
+        results = await asyncio.gather(
+            *(self.get_game_details(url) for url in game_urls),
+            return_exceptions=True,
+        )
+        return [r if not isinstance(r, Exception) else None for r in results]
@@ -5,16 +5,25 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """Basic game information from search results"""
     title: str
     url: str
     thumbnail: Optional[str] = None
     release_date: Optional[str] = None
+    slug: str = ""
 
+    def __post_init__(self):
+        # Derive the slug once at construction instead of per item in
+        # every API response
+        if not self.slug and self.url:
+            parts = self.url.split("/")
+            if len(parts) >= 2:
+                self.slug = parts[-2]
 
-@dataclass
+
+@dataclass(slots=True)
 class SystemRequirements:
     """System requirements for a game"""
     os: Optional[str] = None
@@ -24,7 +33,7 @@ class SystemRequirements:
     storage: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GameDetails(Game):
     """Detailed game information"""
     description: str = ""
@@ -38,7 +47,7 @@ class GameDetails(Game):
     release_date_full: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadInfo:
     """Download information for a game"""
     file_host: str  # e.g., "UploadHaven", "MegaUp", etc.
@@ -48,7 +57,7 @@ class DownloadInfo:
     wait_time: Optional[int] = None  # Seconds to wait
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryInfo:
     """Category information"""
     name: str
@@ -58,7 +67,7 @@ class CategoryInfo:
 
 
 # Available categories on SteamUnlocked
-CATEGORIES = [
+CATEGORIES = (
     "ACTION",
     "ADULT",
     "ADVENTURE",
@@ -77,4 +86,9 @@ CATEGORIES = [
     "SMALL GAMES",
     "SPORTS",
     "VIRTUAL REALITY"
-]
+)
+
+# (name, slug) pairs, computed once at import time
+CATEGORY_SLUGS = tuple(
+    (category, category.lower().replace(" ", "-")) for category in CATEGORIES
+)
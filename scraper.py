@@ -1,16 +1,53 @@
 """
 SteamUnlocked Scraper - Core scraping logic
 """
+import functools
+import io
 import re
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse, parse_qs, quote
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-
-from models import Game, GameDetails, SystemRequirements, DownloadInfo, CATEGORIES
+from lxml import etree
+from selectolax.parser import HTMLParser
+
+from models import Game, GameDetails, SystemRequirements, DownloadInfo, CATEGORY_SLUGS
+
+# Patterns used on every detail page, compiled once at import time
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(GB|MB)", re.I)
+_DOWNLOAD_INSTR_RE = re.compile(r"download.*for pc using the link below", re.I)
+
+# Known file-hosting services, matched in one pass over the domain
+_HOST_RE = re.compile(r"(uploadhaven|megaup|pixeldrain|rapidgator|nitroflare|uploaded)")
+_HOST_NAMES = {
+    "uploadhaven": "UploadHaven",
+    "megaup": "MegaUp",
+    "pixeldrain": "PixelDrain",
+    "rapidgator": "RapidGator",
+    "nitroflare": "NitroFlare",
+    "uploaded": "Uploaded",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _identify_file_host(url: str) -> str:
+    """Identify the file hosting service from URL"""
+    match = _HOST_RE.search(urlparse(url).netloc.lower())
+    return _HOST_NAMES[match.group(1)] if match else "Unknown"
+
+# Keyword probes mapping system-requirement fields to their labels
+_SYS_REQ_FIELDS = (
+    ("os", ("os:", "operating system")),
+    ("processor", ("processor:", "cpu:")),
+    ("memory", ("memory:", "ram:")),
+    ("graphics", ("graphics:", "gpu:", "video:")),
+    ("storage", ("storage:", "disk:")),
+)
 
 
 class SteamUnlockedScraper:
@@ -26,52 +63,107 @@ class SteamUnlockedScraper:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     ]
 
-    def __init__(self, request_delay: float = 1.0):
+    def __init__(self, request_delay: float = 1.0, use_cache: bool = False,
+                 cache_expire_after: int = 3600, backend: str = "requests",
+                 session: Optional[requests.Session] = None):
         """
         Initialize the scraper
 
         Args:
             request_delay: Delay between requests in seconds (default: 1.0)
+            use_cache: Cache responses on disk so repeated fetches of the
+                same page skip the network (requires requests-cache)
+            cache_expire_after: Cache entry lifetime in seconds (default: 1 hour)
+            backend: "requests" (default) or "httpx"; the httpx client
+                multiplexes concurrent fetches over one HTTP/2 connection
+            session: Pre-configured requests.Session to reuse; lets several
+                scrapers share one connection pool. Takes precedence over
+                use_cache/backend, and its mounted adapters are left as-is.
         """
         self.request_delay = request_delay
-        self.session = requests.Session()
-        self.last_request_time = 0
-
-    def _get_random_user_agent(self) -> str:
-        """Get a random user agent"""
-        return random.choice(self.USER_AGENTS)
+        self._request_exc = requests.RequestException
+        if session is not None:
+            self.session = session
+        elif backend == "httpx":
+            import httpx
+            self.session = httpx.Client(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_connections=32),
+                follow_redirects=True,
+            )
+            self._request_exc = httpx.HTTPError
+        elif use_cache:
+            import requests_cache
+            self.session = requests_cache.CachedSession(
+                "steamunlocked_cache",
+                backend="sqlite",
+                expire_after=cache_expire_after,
+                allowable_methods=("GET",),
+            )
+        else:
+            self.session = requests.Session()
+        # All headers are set once on the session; the User-Agent is
+        # picked per instance rather than per request, since mid-session
+        # rotation breaks server-side caching and keep-alive heuristics
+        self._user_agent = random.choice(self.USER_AGENTS)
+        self.session.headers.update({
+            "User-Agent": self._user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        })
+        # Larger urllib3 pool keeps TLS connections warm across requests,
+        # and retries with backoff absorb transient upstream errors
+        # (httpx manages its own pool through Limits above)
+        if session is None and isinstance(self.session, requests.Session):
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3),
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
 
-    def _make_request(self, url: str, timeout: int = 30) -> requests.Response:
+    def _make_request(self, url: str, timeout: int = 30, stream: bool = False) -> requests.Response:
         """
         Make an HTTP request with rate limiting and headers
 
         Args:
             url: URL to request
             timeout: Request timeout in seconds
+            stream: Defer body download so the caller can read incrementally
 
         Returns:
             Response object
         """
-        # Rate limiting
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.request_delay:
-            time.sleep(self.request_delay - time_since_last_request)
-
-        headers = {
-            "User-Agent": self._get_random_user_agent(),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            # "Accept-Encoding": "gzip, deflate",  # Removed to avoid compression issues
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        # Rate limiting: a leaky bucket on the monotonic clock, so wall
+        # clock adjustments cannot skew the delay. The lock hands each
+        # concurrent caller its own slot instead of duplicating sleeps.
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.request_delay
+        if wait > 0:
+            time.sleep(wait)
 
         try:
-            response = self.session.get(url, headers=headers, timeout=timeout)
-            self.last_request_time = time.time()
+            if isinstance(self.session, requests.Session):
+                response = self.session.get(url, timeout=timeout, stream=stream)
+            else:
+                # httpx has no stream kwarg on get(); the body is buffered
+                response = self.session.get(url, timeout=timeout)
+            # A cache hit never touched the network, so hand the reserved
+            # rate-limit slot back to the next caller
+            if getattr(response, "from_cache", False):
+                with self._rate_lock:
+                    self._next_request_time -= self.request_delay
             return response
-        except requests.RequestException as e:
+        except self._request_exc as e:
             raise Exception(f"Request failed: {str(e)}")
 
     def search_games(self, query: str, max_results: int = 20) -> List[Game]:
@@ -85,52 +177,78 @@ class SteamUnlockedScraper:
         Returns:
             List of Game objects
         """
+        return list(self.iter_search_games(query, max_results))
+
+    def iter_search_games(self, query: str, max_results: int = 20):
+        """
+        Lazily yield search results as they are parsed
+
+        Lets consumers bail out early (e.g. after the first match)
+        without paying for the full list.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to yield
+
+        Yields:
+            Game objects
+        """
         # URL encode the query (spaces become +)
         search_url = f"{self.BASE_URL}/?s={quote(query, safe='')}"
 
         response = self._make_request(search_url)
-        soup = BeautifulSoup(response.text, "html.parser")  # Use html.parser for better compatibility
+        yield from self._parse_cover_items(HTMLParser(response.text), limit=max_results)
 
-        games = []
+    def _parse_search_page(self, html: str, max_results: int) -> List[Game]:
+        """Parse a search results page into Game objects"""
+        # Search results use the same cover-item markup as categories
+        return list(self._parse_cover_items(HTMLParser(html), limit=max_results))
+
+    def _parse_cover_items(self, tree: HTMLParser, limit: Optional[int] = None):
+        """
+        Yield Game objects from the "cover-item category" divs on a
+        listing page (search results and category pages share this markup)
 
-        # SteamUnlocked uses div class="cover-item category" for search results
-        cover_items = soup.find_all("div", class_="cover-item category")
+        Args:
+            tree: Parsed selectolax tree of the listing page
+            limit: Maximum number of items to yield, or None for all
+        """
+        cover_items = tree.css("div.cover-item.category")
+        if limit is not None:
+            cover_items = cover_items[:limit]
 
-        for item in cover_items[:max_results]:
+        for item in cover_items:
             try:
                 # Extract title and link from cover-item-title > a > h1
-                title_div = item.find("div", class_="cover-item-title")
+                title_div = item.css_first("div.cover-item-title")
                 if not title_div:
                     continue
 
-                link = title_div.find("a")
+                link = title_div.css_first("a")
                 if not link:
                     continue
 
-                url = link.get("href", "")
-                title_tag = link.find("h1")
-                title = title_tag.get_text(strip=True) if title_tag else link.get_text(strip=True)
+                url = link.attributes.get("href", "")
+                title_tag = link.css_first("h1")
+                title = title_tag.text(strip=True) if title_tag else link.text(strip=True)
 
                 # Extract thumbnail from cover-item-image > a > img
-                img_div = item.find("div", class_="cover-item-image")
+                img_div = item.css_first("div.cover-item-image")
                 thumbnail = None
                 if img_div:
-                    img_tag = img_div.find("img")
+                    img_tag = img_div.css_first("img")
                     if img_tag:
-                        thumbnail = img_tag.get("src") or img_tag.get("data-src")
+                        thumbnail = img_tag.attributes.get("src") or img_tag.attributes.get("data-src")
 
-                games.append(Game(
+                yield Game(
                     title=title,
                     url=url,
-                    thumbnail=thumbnail,
-                    release_date=None
-                ))
+                    thumbnail=thumbnail
+                )
             except Exception as e:
-                print(f"Error parsing game result: {e}")
+                print(f"Error parsing cover item: {e}")
                 continue
 
-        return games
-
     def get_game_details(self, game_url: str) -> Optional[GameDetails]:
         """
         Get detailed information about a game
@@ -142,58 +260,65 @@ class SteamUnlockedScraper:
             GameDetails object or None
         """
         response = self._make_request(game_url)
-        soup = BeautifulSoup(response.text, "html.parser")
+        return self._parse_game_page(response.content, game_url)
+
+    def _parse_game_page(self, content: bytes, game_url: str) -> Optional[GameDetails]:
+        """Parse a game detail page into a GameDetails object"""
+        # lxml.html parses the raw bytes and the XPath lookups below all
+        # execute in C instead of walking the tree at Python speed
+        tree = lxml.html.fromstring(content)
 
         # Extract title
-        title_tag = soup.find("h1") or soup.find("h2", class_="post-title")
-        title = title_tag.get_text(strip=True) if title_tag else ""
+        title_tags = tree.xpath('.//h1') or tree.xpath('.//h2[contains(@class, "post-title")]')
+        title = title_tags[0].text_content().strip() if title_tags else ""
 
         # Extract thumbnail
-        img_tag = soup.find("img", class_=re.compile(r"featured|thumb", re.I))
-        thumbnail = img_tag.get("src") or img_tag.get("data-src") if img_tag else None
+        img_tags = tree.xpath('.//img[contains(@class, "featured") or contains(@class, "thumb")]')
+        thumbnail = (img_tags[0].get("src") or img_tags[0].get("data-src")) if img_tags else None
 
         # Extract description
-        content_div = soup.find("div", class_=re.compile(r"entry|content|post-content", re.I))
+        content_divs = tree.xpath('.//div[contains(@class, "entry") or contains(@class, "content")]')
         description = ""
-        if content_div:
+        if content_divs:
             # Get text content, excluding download section
-            description = content_div.get_text(strip=True)
+            description = content_divs[0].text_content().strip()
 
         # Extract screenshots
         screenshots = []
-        screenshot_imgs = soup.find_all("img", class_=re.compile(r"screenshot|gallery", re.I))
+        screenshot_imgs = tree.xpath('.//img[contains(@class, "screenshot") or contains(@class, "gallery")]')
         for img in screenshot_imgs:
             src = img.get("src") or img.get("data-src")
             if src:
                 screenshots.append(src)
 
         # Extract system requirements
-        sys_req_div = soup.find("div", class_=re.compile(r"system.*req", re.I))
+        sys_req_divs = tree.xpath('.//div[contains(@class, "system") and contains(@class, "req")]')
         system_requirements = None
-        if sys_req_div:
-            system_requirements = self._parse_system_requirements(sys_req_div)
+        if sys_req_divs:
+            system_requirements = self._parse_system_requirements(sys_req_divs[0])
 
         # Extract download link section
-        download_info = self._extract_download_link(soup, title)
+        download_info = self._extract_download_link(tree, title)
 
         # Extract genre/categories
-        genre_tags = soup.find_all("a", rel=re.compile(r"category", re.I))
-        genres = [tag.get_text(strip=True) for tag in genre_tags]
+        genre_tags = tree.xpath('.//a[contains(@rel, "category")]')
+        genres = [tag.text_content().strip() for tag in genre_tags]
 
         # Extract metadata
         developer = None
         publisher = None
         release_date_full = None
 
-        meta_items = soup.find_all("div", class_=re.compile(r"meta|info", re.I))
+        meta_items = tree.xpath('.//div[contains(@class, "meta") or contains(@class, "info")]')
         for item in meta_items:
-            text = item.get_text(strip=True).lower()
-            if "developer" in text or "dev" in text:
-                developer = item.get_text(strip=True).replace("Developer:", "").strip()
-            elif "publisher" in text or "pub" in text:
-                publisher = item.get_text(strip=True).replace("Publisher:", "").strip()
-            elif "release" in text or "published" in text:
-                release_date_full = item.get_text(strip=True).replace("Release Date:", "").strip()
+            text = item.text_content().strip()
+            low = text.lower()
+            if "developer" in low or "dev" in low:
+                developer = text.replace("Developer:", "").strip()
+            elif "publisher" in low or "pub" in low:
+                publisher = text.replace("Publisher:", "").strip()
+            elif "release" in low or "published" in low:
+                release_date_full = text.replace("Release Date:", "").strip()
 
         return GameDetails(
             title=title,
@@ -215,27 +340,30 @@ class SteamUnlockedScraper:
         reqs = SystemRequirements()
 
         # Look for list items or divs containing requirement info
-        items = sys_req_div.find_all(["li", "div", "p", "span"])
+        items = sys_req_div.xpath('.//li|.//div|.//p|.//span')
 
         for item in items:
-            text = item.get_text(strip=True).lower()
-            if "os:" in text or "operating system" in text:
-                reqs.os = item.get_text(strip=True).split(":", 1)[-1].strip()
-            elif "processor:" in text or "cpu:" in text:
-                reqs.processor = item.get_text(strip=True).split(":", 1)[-1].strip()
-            elif "memory:" in text or "ram:" in text:
-                reqs.memory = item.get_text(strip=True).split(":", 1)[-1].strip()
-            elif "graphics:" in text or "gpu:" in text or "video:" in text:
-                reqs.graphics = item.get_text(strip=True).split(":", 1)[-1].strip()
-            elif "storage:" in text or "disk:" in text:
-                reqs.storage = item.get_text(strip=True).split(":", 1)[-1].strip()
+            # Fetch the node text once and probe the lowercased copy
+            text = item.text_content().strip()
+            low = text.lower()
+            for attr, keys in _SYS_REQ_FIELDS:
+                if any(key in low for key in keys):
+                    setattr(reqs, attr, text.split(":", 1)[-1].strip())
+                    break
 
         # Return None if no requirements found
         if any([reqs.os, reqs.processor, reqs.memory, reqs.graphics, reqs.storage]):
             return reqs
         return None
 
-    def _extract_download_link(self, soup: BeautifulSoup, game_title: str) -> Optional[DownloadInfo]:
+    def _find_parent(self, element, tags):
+        """Find the nearest ancestor of element with one of the given tags"""
+        parent = element.getparent()
+        while parent is not None and parent.tag not in tags:
+            parent = parent.getparent()
+        return parent
+
+    def _extract_download_link(self, tree, game_title: str) -> Optional[DownloadInfo]:
         """
         Extract download link from game page
 
@@ -243,40 +371,57 @@ class SteamUnlockedScraper:
         "Download {game_name} for PC using the link below."
 
         Args:
-            soup: BeautifulSoup object of the game page
+            tree: lxml element tree of the game page
             game_title: Title of the game
 
         Returns:
             DownloadInfo object or None
         """
-        # Method 1: Look for download button with class "btn-download"
-        download_btn = soup.find("a", class_="btn-download")
-        if download_btn:
-            url = download_btn.get("href")
-            if url and url.startswith("http"):
-                # Look for file size near the download button
-                file_size = None
-                parent = download_btn.find_parent("div") or download_btn.find_parent("p")
-                if parent:
-                    size_match = re.search(r"(\d+(?:\.\d+)?)\s*(GB|MB)", parent.get_text(), re.I)
-                    if size_match:
-                        file_size = f"{size_match.group(1)} {size_match.group(2)}"
-
-                return DownloadInfo(
-                    file_host=self._identify_file_host(url),
-                    download_url=url,
-                    file_size=file_size
-                )
+        # Classify every anchor in a single pass instead of walking the
+        # whole tree once per candidate selector
+        btn_download = None
+        uploadhaven = None
+        generic_host = None
+        for anchor in tree.xpath('.//a[@href]'):
+            url = anchor.get("href", "")
+            cls = anchor.get("class") or ""
+            if btn_download is None and "btn-download" in cls and url.startswith("http"):
+                btn_download = anchor
+                break  # highest-priority match, nothing beats it
+            if uploadhaven is None and "uploadhaven.com/download/" in url:
+                uploadhaven = anchor
+            elif generic_host is None and ("megaup.net/" in url or "pixeldrain.com/" in url):
+                generic_host = anchor
+
+        # Priority 1: the dedicated download button
+        if btn_download is not None:
+            url = btn_download.get("href")
+            # Look for file size near the download button; prefer the
+            # enclosing div (which usually carries the size text) and
+            # only fall back to a nearer p
+            file_size = None
+            parent = self._find_parent(btn_download, ("div",))
+            if parent is None:
+                parent = self._find_parent(btn_download, ("p",))
+            if parent is not None:
+                size_match = _SIZE_RE.search(parent.text_content())
+                if size_match:
+                    file_size = f"{size_match.group(1)} {size_match.group(2)}"
 
-        # Method 2: Look for any link with uploadhaven.com/download/ using regex
-        download_btn = soup.find("a", href=re.compile(r"uploadhaven\.com/download/"))
-        if download_btn:
-            url = download_btn.get("href")
+            return DownloadInfo(
+                file_host=self._identify_file_host(url),
+                download_url=url,
+                file_size=file_size
+            )
+
+        # Priority 2: any uploadhaven.com/download/ link
+        if uploadhaven is not None:
+            url = uploadhaven.get("href")
             # Look for file size
             file_size = None
-            parent = download_btn.find_parent("div")
-            if parent:
-                size_match = re.search(r"(\d+(?:\.\d+)?)\s*(GB|MB)", parent.get_text(), re.I)
+            parent = self._find_parent(uploadhaven, ("div",))
+            if parent is not None:
+                size_match = _SIZE_RE.search(parent.text_content())
                 if size_match:
                     file_size = f"{size_match.group(1)} {size_match.group(2)}"
 
@@ -286,60 +431,36 @@ class SteamUnlockedScraper:
                 file_size=file_size
             )
 
-        # Method 3: Look for download section with specific text pattern
-        download_pattern = re.compile(r"download.*for pc using the link below", re.I)
-
-        # Search for paragraphs or divs containing download instructions
-        for element in soup.find_all(["p", "div", "span"]):
-            text = element.get_text(strip=True)
-            if download_pattern.search(text):
+        # Priority 3: a download-instructions paragraph wrapping a link
+        for element in tree.xpath('.//p|.//div|.//span'):
+            text = element.text_content()
+            if _DOWNLOAD_INSTR_RE.search(text):
                 # Found the download section, now find the link
-                link = element.find("a", href=True)
-                if link:
-                    url = link.get("href")
-                    # Determine file host from URL
-                    file_host = self._identify_file_host(url)
-
+                links = element.xpath('.//a[@href]')
+                if links:
+                    url = links[0].get("href")
                     # Extract file size if mentioned nearby
-                    size_text = element.get_text()
-                    size_match = re.search(r"(\d+(?:\.\d+)?)\s*(GB|MB)", size_text, re.I)
+                    size_match = _SIZE_RE.search(text)
                     file_size = f"{size_match.group(1)} {size_match.group(2)}" if size_match else None
 
                     return DownloadInfo(
-                        file_host=file_host,
+                        file_host=self._identify_file_host(url),
                         download_url=url,
                         file_size=file_size
                     )
 
-        # Method 4: Fallback - look for any link with known file hosts
-        for btn in soup.find_all("a", href=True):
-            url = btn.get("href")
-            if url and ("uploadhaven.com/download/" in url or "megaup.net/" in url or "pixeldrain.com/" in url):
-                return DownloadInfo(
-                    file_host=self._identify_file_host(url),
-                    download_url=url
-                )
+        # Priority 4: fallback to any other known file host
+        if generic_host is not None:
+            url = generic_host.get("href")
+            return DownloadInfo(
+                file_host=self._identify_file_host(url),
+                download_url=url
+            )
 
         return None
 
-    def _identify_file_host(self, url: str) -> str:
-        """Identify the file hosting service from URL"""
-        domain = urlparse(url).netloc.lower()
-
-        if "uploadhaven" in domain:
-            return "UploadHaven"
-        elif "megaup" in domain:
-            return "MegaUp"
-        elif "pixeldrain" in domain:
-            return "PixelDrain"
-        elif "rapidgator" in domain:
-            return "RapidGator"
-        elif "nitroflare" in domain:
-            return "NitroFlare"
-        elif "uploaded" in domain:
-            return "Uploaded"
-        else:
-            return "Unknown"
+    # Module-level so the lru_cache key is just the URL, not (self, url)
+    _identify_file_host = staticmethod(_identify_file_host)
 
     def get_games_by_category(self, category: str, page: int = 1) -> List[Game]:
         """
@@ -352,52 +473,68 @@ class SteamUnlockedScraper:
         Returns:
             List of Game objects
         """
+        return list(self.iter_games_by_category(category, page))
+
+    def iter_games_by_category(self, category: str, page: int = 1):
+        """
+        Lazily yield games from a category page as they are parsed
+
+        Args:
+            category: Category slug (e.g., "action", "rpg")
+            page: Page number (default: 1)
+
+        Yields:
+            Game objects
+        """
         # Use /category/ instead of /categories/
         category_url = f"{self.BASE_URL}/category/{category.lower()}/"
         if page > 1:
             category_url += f"page/{page}/"
 
         response = self._make_request(category_url)
-        soup = BeautifulSoup(response.text, "html.parser")
+        yield from self._parse_cover_items(HTMLParser(response.text))
 
-        games = []
+    def _parse_category_page(self, html: str) -> List[Game]:
+        """Parse a category listing page into Game objects"""
+        return list(self._parse_cover_items(HTMLParser(html)))
 
-        # Same structure as search: div class="cover-item category"
-        cover_items = soup.find_all("div", class_="cover-item category")
+    def get_games_by_category_pages(self, category: str, pages: List[int],
+                                    max_workers: int = 16) -> List[Game]:
+        """
+        Get games from several pages of a category concurrently
 
-        for item in cover_items:
-            try:
-                # Extract title and link from cover-item-title > a > h1
-                title_div = item.find("div", class_="cover-item-title")
-                if not title_div:
-                    continue
+        The requests run on a thread pool and share the session's
+        connection pool and rate limiter, so keep-alive connections are
+        reused while the per-request delay is still respected.
 
-                link = title_div.find("a")
-                if not link:
-                    continue
+        Args:
+            category: Category slug (e.g., "action", "rpg")
+            pages: Page numbers to fetch
+            max_workers: Maximum number of concurrent requests
 
-                url = link.get("href", "")
-                title_tag = link.find("h1")
-                title = title_tag.get_text(strip=True) if title_tag else link.get_text(strip=True)
+        Returns:
+            List of Game objects from all pages, in page order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda page: self.get_games_by_category(category, page), pages
+            )
+            return [game for page_games in results for game in page_games]
 
-                # Extract thumbnail from cover-item-image > a > img
-                img_div = item.find("div", class_="cover-item-image")
-                thumbnail = None
-                if img_div:
-                    img_tag = img_div.find("img")
-                    if img_tag:
-                        thumbnail = img_tag.get("src") or img_tag.get("data-src")
+    def get_games_a_z_all(self, max_workers: int = 16) -> List[Game]:
+        """
+        Get the A-Z listing for every letter concurrently
 
-                games.append(Game(
-                    title=title,
-                    url=url,
-                    thumbnail=thumbnail
-                ))
-            except Exception as e:
-                print(f"Error parsing category game: {e}")
-                continue
+        Args:
+            max_workers: Maximum number of concurrent requests
 
-        return games
+        Returns:
+            List of Game objects from all letters, in letter order
+        """
+        letters = [chr(c) for c in range(ord("a"), ord("z") + 1)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.get_games_a_z, letters)
+            return [game for letter_games in results for game in letter_games]
 
     def get_games_a_z(self, letter: Optional[str] = None, page: int = 1) -> List[Game]:
         """
@@ -410,6 +547,19 @@ class SteamUnlockedScraper:
         Returns:
             List of Game objects
         """
+        return list(self.iter_games_a_z(letter, page))
+
+    def iter_games_a_z(self, letter: Optional[str] = None, page: int = 1):
+        """
+        Lazily yield games from the A-Z listing as they are parsed
+
+        Args:
+            letter: Letter to filter by (A-Z), or None for all
+            page: Page number (default: 1)
+
+        Yields:
+            Game objects
+        """
         url = f"{self.BASE_URL}/all-games/"
 
         if letter:
@@ -419,40 +569,107 @@ class SteamUnlockedScraper:
             separator = "&" if letter else "?"
             url += f"{separator}page={page}"
 
-        response = self._make_request(url)
-        soup = BeautifulSoup(response.text, "html.parser")
-
+        response = self._make_request(url, stream=True)
         print(f"[DEBUG] A-Z URL: {url}")
-        print(f"[DEBUG] Response length: {len(response.text)}")
+
+        # The all-games listing can be huge; stream-parse it and stop at
+        # the item limit instead of building the whole DOM in memory
+        count = 0
+        if hasattr(response, "raw"):
+            response.raw.decode_content = True  # undo gzip/br before parsing
+            source = response.raw
+        else:
+            # The httpx backend already buffered the body; parse from memory
+            source = io.BytesIO(response.content)
+        try:
+            for _, elem in etree.iterparse(source, events=("end",),
+                                           html=True, tag="div"):
+                if "su-pop-item" not in (elem.get("class") or ""):
+                    continue
+
+                game = self._parse_pop_item(elem)
+                elem.clear()  # release the subtree we just consumed
+                if game is not None:
+                    yield game
+                    count += 1
+
+                if count >= 100:  # Limit to 100 games
+                    break
+        finally:
+            response.close()
+
+    def _parse_pop_item(self, elem) -> Optional[Game]:
+        """Parse a single su-pop-item div into a Game"""
+        try:
+            # Find the info div (link + title) and img div (thumbnail)
+            info_div = None
+            img_div = None
+            for child in elem.iter("div"):
+                cls = (child.get("class") or "").split()
+                if info_div is None and "info" in cls:
+                    info_div = child
+                elif img_div is None and "img" in cls:
+                    img_div = child
+
+            if info_div is None:
+                return None
+
+            link = info_div.find(".//a")
+            if link is None:
+                return None
+
+            url = link.get("href", "")
+            # iterparse yields plain _Element nodes, so no text_content()
+            title = "".join(link.itertext()).strip()
+
+            thumbnail = None
+            if img_div is not None:
+                img_tag = img_div.find(".//img")
+                if img_tag is not None:
+                    # Try data-wpfc-original-src first (lazy loaded), then src
+                    thumbnail = img_tag.get("data-wpfc-original-src") or img_tag.get("src")
+
+            return Game(
+                title=title,
+                url=url,
+                thumbnail=thumbnail
+            )
+        except Exception as e:
+            print(f"Error parsing A-Z game: {e}")
+            return None
+
+    def _parse_az_page(self, html: str) -> List[Game]:
+        """Parse an A-Z listing page into Game objects"""
+        tree = HTMLParser(html)
 
         games = []
 
         # A-Z page uses div class="su-pop-item" structure
-        pop_items = soup.find_all("div", class_="su-pop-item")
+        pop_items = tree.css("div.su-pop-item")
         print(f"[DEBUG] Found {len(pop_items)} pop items")
 
         for item in pop_items[:100]:  # Limit to 100 games
             try:
                 # Find the info div which contains the link
-                info_div = item.find("div", class_="info")
+                info_div = item.css_first("div.info")
                 if not info_div:
                     continue
 
-                link = info_div.find("a")
+                link = info_div.css_first("a")
                 if not link:
                     continue
 
-                url = link.get("href", "")
-                title = link.get_text(strip=True)
+                url = link.attributes.get("href", "")
+                title = link.text(strip=True)
 
                 # Extract thumbnail from img div
-                img_div = item.find("div", class_="img")
+                img_div = item.css_first("div.img")
                 thumbnail = None
                 if img_div:
-                    img_tag = img_div.find("img")
+                    img_tag = img_div.css_first("img")
                     if img_tag:
                         # Try data-wpfc-original-src first (lazy loaded), then src
-                        thumbnail = img_tag.get("data-wpfc-original-src") or img_tag.get("src")
+                        thumbnail = img_tag.attributes.get("data-wpfc-original-src") or img_tag.attributes.get("src")
 
                 games.append(Game(
                     title=title,
@@ -472,12 +689,11 @@ class SteamUnlockedScraper:
         Returns:
             List of category dictionaries
         """
-        categories = []
-        for category in CATEGORIES:
-            slug = category.lower().replace(" ", "-")
-            categories.append({
-                "name": category,
+        return [
+            {
+                "name": name,
                 "slug": slug,
                 "url": f"{self.BASE_URL}/categories/{slug}/"
-            })
-        return categories
+            }
+            for name, slug in CATEGORY_SLUGS
+        ]
@@ -2,210 +2,361 @@
 SteamUnlocked Web Interface
 Complete web interface for searching, browsing, and auto-downloading games
 """
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response
 import os
 import asyncio
+import hashlib
+import logging
+import re
 import threading
-from scraper import SteamUnlockedScraper
-from models import CATEGORIES
-from playwright.async_api import async_playwright
+import time
+import uuid
+import httpx
+import orjson
+from cachetools import TTLCache
+from jinja2 import FileSystemBytecodeCache
+from async_scraper import AsyncSteamUnlockedScraper
+from models import CATEGORY_SLUGS
+from playwright.async_api import (
+    async_playwright,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+# At the default INFO level the per-step DEBUG lines in the download
+# automation short-circuit before formatting, instead of one stdout
+# write per step
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+log = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-# Initialize scraper
-scraper = SteamUnlockedScraper(request_delay=1.0)
+# Compiled templates are cached on disk across restarts, and auto_reload
+# skips the per-render mtime stat on every template
+os.makedirs("/tmp/jinja_bcc", exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache("/tmp/jinja_bcc")
+app.jinja_env.auto_reload = False
 
+# index and test take no per-request context; render them once at
+# startup and serve the bytes
+with app.app_context():
+    _INDEX_HTML = render_template("index.html").encode()
+    _TEST_HTML = render_template("test.html").encode()
 
-async def auto_download_playwright_async(game_url: str, headless: bool = False):
+# Initialize scraper; all fetches run on the background event loop and
+# share one aiohttp connection pool instead of blocking per request
+scraper = AsyncSteamUnlockedScraper()
+
+# The category list never changes at runtime; serialize it once and
+# serve the cached bytes
+_CATEGORIES_JSON = orjson.dumps({
+    "categories": [{"name": name, "slug": slug} for name, slug in CATEGORY_SLUGS]
+})
+
+
+def ojson(payload, status: int = 200) -> Response:
+    """Build a JSON response with orjson instead of Flask's jsonify"""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def cached_json(payload, ttl: int = 300) -> Response:
+    """
+    JSON response with a content-hash ETag and Cache-Control
+
+    Browsers (and any CDN in front) can then revalidate with
+    If-None-Match and get a bodyless 304 instead of re-hitting the
+    scraper for identical queries.
+
+    Args:
+        payload: Response dict, or pre-serialized JSON bytes
+        ttl: max-age for the Cache-Control header in seconds
+    """
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    # RFC 7232 entity-tags are quoted strings; intermediaries may drop
+    # an unquoted one
+    headers = {"ETag": f'"{etag}"', "Cache-Control": f"public, max-age={ttl}"}
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype="application/json", headers=headers)
+
+# Response payloads per endpoint, keyed by query args; a hit skips the
+# scraper's network round-trip and HTML parse entirely
+SEARCH_CACHE = TTLCache(maxsize=1024, ttl=300)
+CAT_CACHE = TTLCache(maxsize=512, ttl=600)
+AZ_CACHE = TTLCache(maxsize=512, ttl=600)
+GAME_CACHE = TTLCache(maxsize=2048, ttl=1800)
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache, key):
+    with _cache_lock:
+        return cache.get(key)
+
+
+def _cache_set(cache, key, value):
+    with _cache_lock:
+        cache[key] = value
+
+# One event loop on a dedicated thread hosts everything async: the
+# shared Playwright browser (Chromium cold start costs 1-3 seconds, so
+# download jobs just open their own context on it) and the aiohttp-based
+# scraper, whose pooled connections stay warm across API requests.
+BACKGROUND_LOOP = asyncio.new_event_loop()
+
+# Each job is a full Chromium context (~hundreds of MB); cap how many
+# run at once and how many may queue behind them before refusing
+MAX_PW_JOBS = int(os.environ.get("MAX_PW_JOBS", "3"))
+PW_QUEUE_LIMIT = MAX_PW_JOBS * 2
+PW_JOB_SEMAPHORE = asyncio.Semaphore(MAX_PW_JOBS)
+
+_context = None
+_context_lock = asyncio.Lock()
+
+# The automation only needs the download anchors; imagery, fonts,
+# styles, and trackers are wasted bandwidth (a typical game page drops
+# from a few MB to a couple hundred KB with these blocked)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_TRACKER_HOSTS = ("doubleclick", "google-analytics", "googletagmanager")
+_jobs_in_flight = 0
+_jobs_lock = threading.Lock()
+
+# Download jobs by id, so clients can poll completion instead of
+# firing duplicate requests into the dark; a finished job's result
+# stays pollable for JOB_RESULT_TTL seconds after completion
+JOBS = {}
+JOB_DONE_AT = {}
+JOB_RESULT_TTL = 600
+
+# Many game pages carry the UploadHaven link as a static href; a plain
+# HTTP fetch finds it in ~200 ms, making the multi-second Chromium
+# session the fallback instead of the default
+_UPLOADHAVEN_LINK_RE = re.compile(r"https?://uploadhaven\.com/download/[A-Za-z0-9]+")
+_preflight_client = httpx.Client(
+    headers={"User-Agent": AsyncSteamUnlockedScraper.USER_AGENTS[0]},
+    timeout=10,
+    follow_redirects=True,
+)
+
+
+def _preflight_download_link(game_url: str):
+    """Extract a static UploadHaven link without launching a browser"""
+    try:
+        response = _preflight_client.get(game_url)
+        match = _UPLOADHAVEN_LINK_RE.search(response.text)
+        return match.group(0) if match else None
+    except httpx.HTTPError:
+        return None
+
+
+def _run_background_loop():
+    asyncio.set_event_loop(BACKGROUND_LOOP)
+    BACKGROUND_LOOP.run_forever()
+
+
+threading.Thread(target=_run_background_loop, daemon=True,
+                 name="background-loop").start()
+
+
+def run_async(coro, timeout: int = 60):
+    """Run a coroutine on the background loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, BACKGROUND_LOOP).result(timeout=timeout)
+
+
+async def _get_context():
+    """
+    Launch the shared persistent browser context on first use
+
+    A persistent profile keeps cookies and localStorage between jobs, so
+    UploadHaven's cookie consent and countdown tokens are set once
+    instead of on every download.
+    """
+    global _context
+    async with _context_lock:
+        if _context is None:
+            playwright = await async_playwright().start()
+            _context = await playwright.chromium.launch_persistent_context(
+                user_data_dir=os.environ.get("PW_PROFILE_DIR", "/tmp/pw-profile"),
+                headless=True,
+                args=[
+                    '--disable-blink-features=AutomationControlled',
+                    '--disable-dev-shm-usage',
+                    '--no-sandbox',
+                    '--disable-gpu',
+                    '--blink-settings=imagesEnabled=false',
+                ],
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                viewport={'width': 1920, 'height': 1080},
+            )
+            # JavaScript stays enabled (the countdown needs it), but heavy
+            # and tracker resources are aborted before they hit the network
+            await _context.route("**/*", _block_heavy_resources)
+    return _context
+
+
+async def _block_heavy_resources(route):
+    """Abort requests for resources the automation never looks at"""
+    req = route.request
+    if req.resource_type in BLOCKED_RESOURCE_TYPES or \
+            any(host in req.url for host in BLOCKED_TRACKER_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def playwright_busy() -> bool:
+    """True when the download job queue is saturated"""
+    return _jobs_in_flight >= PW_QUEUE_LIMIT
+
+
+def submit_playwright_job(game_url: str, headless: bool = False):
+    """
+    Submit a download job to the shared Playwright event loop
+
+    At most MAX_PW_JOBS jobs run concurrently; surplus submissions wait
+    on the semaphore inside the loop.
+
+    Returns:
+        concurrent.futures.Future for the job result
+    """
+    global _jobs_in_flight
+
+    async def job():
+        async with PW_JOB_SEMAPHORE:
+            return await auto_download_playwright_async(game_url, headless)
+
+    with _jobs_lock:
+        _jobs_in_flight += 1
+    future = asyncio.run_coroutine_threadsafe(job(), BACKGROUND_LOOP)
+
+    def _job_done(_future):
+        global _jobs_in_flight
+        with _jobs_lock:
+            _jobs_in_flight -= 1
+
+    future.add_done_callback(_job_done)
+    return future
+
+
+async def auto_download_playwright_async(game_url: str, headless: bool = True):
     """
     Open the game page on SteamUnlocked and click download button using Playwright
 
+    Runs on the shared persistent context; each call gets its own pages.
+
     Args:
         game_url: URL of the game page on SteamUnlocked
-        headless: Run in headless mode (default: False)
+        headless: Kept for API compatibility; the shared context is headless
     """
-    print("=" * 60)
-    print("SteamUnlocked Auto Download - Playwright Version")
-    print("=" * 60)
-    print(f"\nGame URL: {game_url}\n")
-
-    async with async_playwright() as p:
-        # Launch browser
-        print("Step 1: Launching browser...")
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-
-        # Create context with realistic user agent
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={'width': 1920, 'height': 1080}
-        )
-
-        page = await context.new_page()
+    log.info("Auto download starting for %s", game_url)
+
+    # Step 1: Reuse the long-lived persistent context
+    log.debug("Step 1: getting shared browser context")
+    context = await _get_context()
 
+    page = await context.new_page()
+    new_page = None
+
+    try:
+        # Step 2: Navigate to game page
+        log.debug("Step 2: opening game page on SteamUnlocked")
+        await page.goto(game_url, wait_until='domcontentloaded', timeout=30000)
+        log.debug("Game page loaded")
+
+        # Step 3: Find download button
+        log.debug("Step 3: looking for download button")
+        download_btn = None
         try:
-            # Step 2: Navigate to game page
-            print("Step 2: Opening game page on SteamUnlocked...")
-            await page.goto(game_url, wait_until='domcontentloaded', timeout=30000)
-            print("✓ Game page loaded")
+            # One locator with an OR selector covers both button styles in
+            # a single browser-side query, instead of a separate
+            # query_selector round-trip per fallback
+            download_btn = await page.locator(
+                "a.btn-download, a[href*='uploadhaven.com/download/']"
+            ).first.element_handle(timeout=10000)
+            log.debug("Found download button")
+        except PlaywrightTimeoutError:
+            pass
+
+        if not download_btn:
+            log.info("Download button not found on %s", game_url)
+            return False
 
-            # Step 3: Find download button
-            print("\nStep 3: Looking for download button...")
-            await page.wait_for_timeout(2000)  # Wait for dynamic content
+        # Step 4: Scroll to button
+        log.debug("Step 4: scrolling to download button")
+        await download_btn.scroll_into_view_if_needed()
 
-            download_btn = None
+        # Step 5: Click download button
+        log.debug("Step 5: clicking download button")
 
-            # Method 1: btn-download class
-            try:
-                download_btn = await page.query_selector("a.btn-download")
-                if download_btn:
-                    print("✓ Found download button (btn-download class)")
-            except:
-                pass
-
-            # Method 2: Link with uploadhaven
-            if not download_btn:
-                try:
-                    download_btn = await page.query_selector("a[href*='uploadhaven.com/download/']")
-                    if download_btn:
-                        print("✓ Found download button (uploadhaven link)")
-                except:
-                    pass
-
-            if not download_btn:
-                print("✗ Download button not found!")
-                print("\nWaiting 10 seconds before closing...")
-                await page.wait_for_timeout(10000)
-                return False
-
-            # Step 4: Scroll to button
-            print("\nStep 4: Scrolling to download button...")
-            await download_btn.scroll_into_view_if_needed()
-            await page.wait_for_timeout(1000)
-
-            # Highlight button
-            await page.eval_on_selector("a.btn-download", "el => el.style.border='3px solid red'")
-
-            # Step 5: Click download button
-            print("\nStep 5: Clicking download button...")
-
-            # Create new page for download link
-            async with context.expect_page() as new_page_info:
-                await download_btn.click()
-
-            new_page = await new_page_info.value
-            print("✓ Download button clicked!")
-
-            # Step 6: Handle UploadHaven
-            print("\nStep 6: Waiting for UploadHaven page...")
-            await new_page.wait_for_load_state('domcontentloaded', timeout=15000)
-
-            current_url = new_page.url
-            print(f"Current URL: {current_url}")
-
-            if "uploadhaven.com" in current_url:
-                print("✓ UploadHaven page opened")
-
-                # Look for countdown or download button
-                print("\nStep 7: Looking for countdown/download button...")
-
-                # Wait for page to fully load and countdown to complete (wait 16 seconds)
-                print("⏳ Waiting 16 seconds for countdown to complete...")
-                await new_page.wait_for_timeout(16000)
-                print("✓ Initial wait completed")
-
-                # Try to find countdown
-                try:
-                    # Look for countdown elements
-                    countdown_elements = await new_page.query_selector_all("[class*='countdown'], [id*='countdown']")
-                    if countdown_elements:
-                        countdown_text = await new_page.evaluate("el => el.textContent", countdown_elements[0])
-                        print(f"Countdown found: {countdown_text}")
-
-                    # Look for free download button
-                    free_download_btns = await new_page.query_selector_all("button:has-text('Free Download'), [class*='download']")
-                    if free_download_btns:
-                        print("✓ Free Download button found!")
-
-                        # Check if enabled
-                        is_enabled = await new_page.evaluate("el => !el.disabled", free_download_btns[0])
-
-                        if is_enabled:
-                            print("✓ Button is enabled, clicking...")
-                            await free_download_btns[0].click()
-                            print("✓ Download started!")
-                        else:
-                            print("⏳ Button is disabled, waiting for countdown...")
-
-                            # Wait for button to become enabled (up to 60 seconds)
-                            for i in range(60):
-                                await new_page.wait_for_timeout(1000)
-                                is_enabled = await new_page.evaluate("el => !el.disabled", free_download_btns[0])
-
-                                if is_enabled:
-                                    print(f"✓ Button enabled after {i+1} seconds, clicking...")
-                                    await free_download_btns[0].click()
-                                    print("✓ Download started!")
-                                    break
-
-                                if i % 10 == 0:
-                                    print(f"  Waiting... {i}/60 seconds")
-                    else:
-                        print("⚠ No download button found yet")
-                        print("  The countdown may still be running")
-
-                except Exception as e:
-                    print(f"Error handling UploadHaven: {e}")
-
-                # Keep browser open for manual interaction if not headless
-                if not headless:
-                    print("\n" + "=" * 60)
-                    print("Download initiated! Browser will stay open for 30 seconds")
-                    print("You can interact with the browser if needed")
-                    print("=" * 60)
-                    await page.wait_for_timeout(30000)
-
-            else:
-                print(f"✗ Unexpected URL: {current_url}")
-                print("Waiting 10 seconds before closing...")
-                await page.wait_for_timeout(10000)
-
-            return True
+        # Create new page for download link
+        async with context.expect_page() as new_page_info:
+            await download_btn.click()
 
-        except Exception as e:
-            print(f"\n[ERROR] {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False
+        new_page = await new_page_info.value
+        log.debug("Download button clicked")
 
-        finally:
-            await browser.close()
-            print("\nBrowser closed")
+        # Step 6: Handle UploadHaven
+        log.debug("Step 6: waiting for UploadHaven page")
+        await new_page.wait_for_load_state('domcontentloaded', timeout=15000)
 
+        current_url = new_page.url
+        log.debug("Current URL: %s", current_url)
 
-def run_playwright_in_thread(game_url: str, headless: bool = False):
-    """Run Playwright async function in a thread"""
-    def run():
-        asyncio.run(auto_download_playwright_async(game_url, headless))
+        if "uploadhaven.com" in current_url:
+            # Step 7: Wait for the countdown to release the button
+            log.debug("Step 7: waiting for download button to become clickable")
 
-    thread = threading.Thread(target=run)
-    thread.daemon = True
-    thread.start()
-    return thread
+            try:
+                free_download_btn = new_page.locator(
+                    "button:has-text('Free Download'), button[class*='download']"
+                ).first
+                await free_download_btn.wait_for(state="attached", timeout=30000)
+                log.debug("Free Download button found")
+
+                # locator.click() auto-waits until the countdown enables
+                # the button, so no manual polling is needed
+                await free_download_btn.click(timeout=60000)
+                log.info("Download started for %s", game_url)
+
+            except PlaywrightTimeoutError:
+                log.info("Download button never became clickable; "
+                         "the countdown may still be running")
+            except PlaywrightError as e:
+                # Only browser-side failures; cancellation and interrupts
+                # propagate so a hung job frees its Chromium promptly
+                log.info("Error handling UploadHaven: %s", e)
+
+        else:
+            log.info("Unexpected URL after download click: %s", current_url)
+
+        return True
+
+    except Exception:
+        log.exception("Auto download failed for %s", game_url)
+        return False
+
+    finally:
+        # Only this job's pages are torn down; the persistent context
+        # (and its cookies) stays warm for the next request
+        if new_page is not None and not new_page.is_closed():
+            await new_page.close()
+        await page.close()
+        log.debug("Pages closed")
 
 
 @app.route("/")
 def index():
     """Home page with search and categories"""
-    return render_template("index.html")
+    return Response(_INDEX_HTML, mimetype="text/html")
 
 
 @app.route("/test")
 def test():
     """Test page for API endpoints"""
-    return render_template("test.html")
+    return Response(_TEST_HTML, mimetype="text/html")
 
 
 @app.route("/search")
@@ -245,25 +396,30 @@ def api_search():
     limit = request.args.get("limit", "20")
 
     if not query:
-        return jsonify({"error": "Search query required"}), 400
+        return ojson({"error": "Search query required"}, status=400)
 
     try:
         limit = int(limit)
     except ValueError:
         limit = 20
 
-    games = scraper.search_games(query, max_results=limit)
-
-    return jsonify({
-        "query": query,
-        "count": len(games),
-        "results": [{
-            "title": g.title,
-            "url": g.url,
-            "thumbnail": g.thumbnail,
-            "slug": g.url.split("/")[-2] if g.url else ""
-        } for g in games]
-    })
+    cache_key = (query.lower(), limit)
+    payload = _cache_get(SEARCH_CACHE, cache_key)
+    if payload is None:
+        games = run_async(scraper.search_games(query, max_results=limit))
+        payload = {
+            "query": query,
+            "count": len(games),
+            "results": [{
+                "title": g.title,
+                "url": g.url,
+                "thumbnail": g.thumbnail,
+                "slug": g.slug
+            } for g in games]
+        }
+        _cache_set(SEARCH_CACHE, cache_key, payload)
+
+    return cached_json(payload)
 
 
 @app.route("/api/category/<category>")
@@ -276,19 +432,24 @@ def api_category(category):
     except ValueError:
         page = 1
 
-    games = scraper.get_games_by_category(category.lower(), page=page)
-
-    return jsonify({
-        "category": category,
-        "page": page,
-        "count": len(games),
-        "results": [{
-            "title": g.title,
-            "url": g.url,
-            "thumbnail": g.thumbnail,
-            "slug": g.url.split("/")[-2] if g.url else ""
-        } for g in games]
-    })
+    cache_key = (category.lower(), page)
+    payload = _cache_get(CAT_CACHE, cache_key)
+    if payload is None:
+        games = run_async(scraper.get_games_by_category(category.lower(), page=page))
+        payload = {
+            "category": category,
+            "page": page,
+            "count": len(games),
+            "results": [{
+                "title": g.title,
+                "url": g.url,
+                "thumbnail": g.thumbnail,
+                "slug": g.slug
+            } for g in games]
+        }
+        _cache_set(CAT_CACHE, cache_key, payload)
+
+    return cached_json(payload)
 
 
 @app.route("/api/games/az")
@@ -302,33 +463,30 @@ def api_games_az():
     except ValueError:
         page = 1
 
-    games = scraper.get_games_a_z(letter=letter or None, page=page)
-
-    return jsonify({
-        "letter": letter or "All",
-        "page": page,
-        "count": len(games),
-        "results": [{
-            "title": g.title,
-            "url": g.url,
-            "thumbnail": g.thumbnail,
-            "slug": g.url.split("/")[-2] if g.url else ""
-        } for g in games]
-    })
+    cache_key = (letter.lower(), page)
+    payload = _cache_get(AZ_CACHE, cache_key)
+    if payload is None:
+        games = run_async(scraper.get_games_a_z(letter=letter or None, page=page))
+        payload = {
+            "letter": letter or "All",
+            "page": page,
+            "count": len(games),
+            "results": [{
+                "title": g.title,
+                "url": g.url,
+                "thumbnail": g.thumbnail,
+                "slug": g.slug
+            } for g in games]
+        }
+        _cache_set(AZ_CACHE, cache_key, payload)
+
+    return cached_json(payload)
 
 
 @app.route("/api/categories")
 def api_categories():
     """API: Get all categories"""
-    categories = []
-    for cat in CATEGORIES:
-        slug = cat.lower().replace(" ", "-")
-        categories.append({
-            "name": cat,
-            "slug": slug
-        })
-
-    return jsonify({"categories": categories})
+    return cached_json(_CATEGORIES_JSON, ttl=86400)
 
 
 @app.route("/api/game-info")
@@ -337,32 +495,39 @@ def api_game_info():
     slug = request.args.get("slug", "").strip()
 
     if not slug:
-        return jsonify({"error": "Slug is required"}), 400
+        return ojson({"error": "Slug is required"}, status=400)
 
     try:
-        # Construct full URL from slug
-        game_url = f"https://steamunlocked.org/{slug}"
-
-        # Fetch game details using scraper
-        game_details = scraper.get_game_details(game_url)
-
-        if game_details:
-            return jsonify({
-                "title": game_details.title,
-                "url": game_details.url,
-                "thumbnail": game_details.thumbnail,
-                "description": game_details.description[:500] + "..." if game_details.description and len(game_details.description) > 500 else game_details.description,
-                "screenshots": game_details.screenshots[:5],  # Limit to 5 screenshots
-                "genre": game_details.genre,
-                "developer": game_details.developer,
-                "publisher": game_details.publisher,
-                "release_date": game_details.release_date_full
-            })
+        payload = _cache_get(GAME_CACHE, slug)
+        if payload is None:
+            # Construct full URL from slug
+            game_url = f"https://steamunlocked.org/{slug}"
+
+            # Fetch game details using scraper
+            game_details = run_async(scraper.get_game_details(game_url))
+
+            if game_details:
+                desc = game_details.description or ""
+                payload = {
+                    "title": game_details.title,
+                    "url": game_details.url,
+                    "thumbnail": game_details.thumbnail,
+                    "description": f"{desc[:500]}..." if len(desc) > 500 else desc,
+                    "screenshots": game_details.screenshots[:5],  # Limit to 5 screenshots
+                    "genre": game_details.genre,
+                    "developer": game_details.developer,
+                    "publisher": game_details.publisher,
+                    "release_date": game_details.release_date_full
+                }
+                _cache_set(GAME_CACHE, slug, payload)
+
+        if payload:
+            return ojson(payload)
         else:
-            return jsonify({"error": "Game not found"}), 404
+            return ojson({"error": "Game not found"}, status=404)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojson({"error": str(e)}, status=500)
 
 
 @app.route("/api/auto-download-playwright", methods=["POST"])
@@ -372,38 +537,80 @@ def auto_download_playwright():
 
     JSON Body:
         - url: Game page URL on SteamUnlocked
-        - headless: (optional) Run in headless mode (default: false)
+        - headless: (optional) Run in headless mode (default: true)
 
-    This endpoint runs the Playwright automation directly to automatically click download buttons
+    Returns 202 Accepted with a job_id; poll GET /api/job/<job_id> for
+    completion instead of reissuing the download.
     """
     data = request.get_json()
     if not data or "url" not in data:
-        return jsonify({"error": "URL is required"}), 400
+        return ojson({"error": "URL is required"}, status=400)
 
     game_url = data["url"]
-    headless = data.get("headless", False)
+    headless = data.get("headless", True)
 
-    try:
-        # Run Playwright directly in a thread
-        thread = run_playwright_in_thread(game_url, headless)
+    # Preflight: when the download link sits statically in the page HTML,
+    # hand it back directly and skip the browser session entirely
+    direct_url = _preflight_download_link(game_url)
+    if direct_url:
+        return ojson({
+            "success": True,
+            "direct_url": direct_url,
+            "game_url": game_url,
+            "method": "preflight",
+        })
+
+    # Refuse instead of queueing unboundedly; each job costs a Chromium
+    if playwright_busy():
+        return ojson({"error": "busy"}, status=429)
 
-        return jsonify({
+    try:
+        # Drop only jobs that finished long enough ago for any client to
+        # have polled them, so a fresh 202 never 404s on its first poll
+        now = time.monotonic()
+        for jid, done_at in list(JOB_DONE_AT.items()):
+            if now - done_at > JOB_RESULT_TTL:
+                JOBS.pop(jid, None)
+                JOB_DONE_AT.pop(jid, None)
+
+        # Submit the job to the shared browser's event loop
+        job_id = uuid.uuid4().hex
+        future = submit_playwright_job(game_url, headless)
+        future.add_done_callback(
+            lambda _f, jid=job_id: JOB_DONE_AT.setdefault(jid, time.monotonic()))
+        JOBS[job_id] = future
+
+        return ojson({
             "success": True,
+            "job_id": job_id,
             "message": "Playwright auto-download started",
             "game_url": game_url,
-            "thread_id": thread.ident,
             "headless": headless,
-            "note": "Playwright is running in the background"
-        })
+        }, status=202)
 
     except Exception as e:
-        return jsonify({
+        return ojson({
             "success": False,
             "error": str(e)
-        }), 500
+        }, status=500)
+
+
+@app.route("/api/job/<job_id>")
+def api_job(job_id):
+    """API: Poll the status of an auto-download job"""
+    future = JOBS.get(job_id)
+    if future is None:
+        return ojson({"error": "Unknown job id"}, status=404)
+
+    payload = {"job_id": job_id, "done": future.done()}
+    if future.done():
+        try:
+            payload["result"] = future.result()
+        except Exception as e:
+            payload["error"] = str(e)
+    return ojson(payload)
 
 
 if __name__ == "__main__":
-    print("Starting SteamUnlocked Web Interface...")
-    print("Open http://localhost:5000 in your browser")
+    log.info("Starting SteamUnlocked Web Interface on http://localhost:5000")
     app.run(host="0.0.0.0", port=5000, debug=True)
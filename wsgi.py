@@ -0,0 +1,15 @@
+"""
+WSGI entrypoint for production servers
+
+Run under gunicorn with threaded workers so slow scraper calls overlap:
+
+    gunicorn -k gthread -w 4 --threads 16 wsgi:app
+
+gevent/eventlet workers are not supported: the app hosts a background
+asyncio event loop (aiohttp scraper + shared Playwright browser) that
+monkey-patching would break.
+"""
+from web_app import app
+
+if __name__ == "__main__":
+    app.run()